@@ -2,8 +2,10 @@
 FastAPI dependency injection for shared resources.
 """
 
+import asyncio
 from fastapi import Request, HTTPException
-from typing import Annotated
+from starlette.concurrency import run_in_threadpool
+from typing import Annotated, Any, Callable
 
 from db import Database
 from core.services import SimulationService, ReasoningService, DataService
@@ -61,3 +63,21 @@ DIContainerDep = Annotated[DIContainer, get_di_container]
 SimulationServiceDep = Annotated[SimulationService, get_simulation_service]
 ReasoningServiceDep = Annotated[ReasoningService, get_reasoning_service]
 DataServiceDep = Annotated[DataService, get_data_service]
+
+
+# Simulation runs swap the process-wide sys.stdout/sys.stderr while capturing
+# output, so heavy jobs still execute one at a time. The lock is awaited on the
+# event loop, so queued jobs do not sit on threadpool tokens that sync
+# dependencies also need.
+_BLOCKING_WORK_LOCK = asyncio.Lock()
+
+
+async def run_blocking(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run blocking simulation/LLM work in the threadpool instead of on the event loop.
+    
+    Keeps lightweight endpoints (liveness, listings, searches) responsive while a
+    long simulation or reasoning session is in progress.
+    """
+    async with _BLOCKING_WORK_LOCK:
+        return await run_in_threadpool(func, *args, **kwargs)
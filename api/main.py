@@ -63,7 +63,7 @@ async def lifespan(app: FastAPI):
     try:
         simulation_service = di_container.get("simulation_service")
         simulation_service.cleanup()
-    except:
+    except Exception:
         pass
 
 
@@ -12,12 +12,23 @@ from datetime import datetime
 from execute import SimulationRunner
 from reasoning import ReasoningAgent
 from ..models import HealthResponse, HealthStatus, ComponentHealth, TestRequest, TestResponse
-from ..dependencies import get_database
+from ..dependencies import get_database, run_blocking
 
 
 router = APIRouter()
 
 
+@router.api_route("/live", methods=["GET", "HEAD"], summary="Liveness probe")
+async def health_live():
+    """
+    Cheap liveness check.
+    
+    Confirms the server is accepting requests without touching the database or
+    running a test simulation; use `/health/status` for component health.
+    """
+    return {"status": "ok"}
+
+
 @router.get("/status", response_model=HealthResponse, summary="System health status")
 async def health_status(db = Depends(get_database)):
     """
@@ -61,7 +72,7 @@ def simulate(**params):
         
         try:
             runner = SimulationRunner()
-            result = runner.run(Path(temp_path), {"x": 5})
+            result = await run_blocking(runner.run, Path(temp_path), {"x": 5})
             
             if result.get("_ok", False) and result.get("result") == 10:
                 components.append(ComponentHealth(
@@ -97,7 +108,7 @@ def simulate(**params):
         models_dir = Path(settings.models_dir)
         
         if models_dir.exists():
-            model_count = len(list(models_dir.glob("*/simulate.py")))
+            model_count = sum(1 for _ in models_dir.glob("*/simulate.py"))
             components.append(ComponentHealth(
                 name="models_directory",
                 status=HealthStatus.HEALTHY,
@@ -139,7 +150,7 @@ async def run_test(request: TestRequest, db = Depends(get_database)):
     
     Returns test results and performance metrics.
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:
         if request.test_type == "simulation":
@@ -157,7 +168,7 @@ async def run_test(request: TestRequest, db = Depends(get_database)):
             )
             
     except Exception as e:
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         return TestResponse(
             test_type=request.test_type,
             success=False,
@@ -168,7 +179,7 @@ async def run_test(request: TestRequest, db = Depends(get_database)):
 
 async def _test_simulation(parameters: Dict[str, Any]) -> TestResponse:
     """Test simulation execution."""
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     # Create test script
     test_script = '''
@@ -189,9 +200,9 @@ def simulate(x=1, y=2):
     try:
         runner = SimulationRunner()
         test_params = parameters.get("params", {"x": 3, "y": 4})
-        result = runner.run(Path(temp_path), test_params)
+        result = await run_blocking(runner.run, Path(temp_path), test_params)
         
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         
         success = result.get("_ok", False)
         details = {
@@ -223,7 +234,7 @@ def simulate(x=1, y=2):
 
 async def _test_database(db, parameters: Dict[str, Any]) -> TestResponse:
     """Test database operations."""
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     details = {}
     
@@ -254,7 +265,7 @@ async def _test_database(db, parameters: Dict[str, Any]) -> TestResponse:
                 conn.execute("DELETE FROM simulations WHERE id = ?", (test_id,))
                 details["write_test"] = "passed"
         
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         
         return TestResponse(
             test_type="database",
@@ -265,7 +276,7 @@ async def _test_database(db, parameters: Dict[str, Any]) -> TestResponse:
         )
         
     except Exception as e:
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         return TestResponse(
             test_type="database",
             success=False,
@@ -277,7 +288,7 @@ async def _test_database(db, parameters: Dict[str, Any]) -> TestResponse:
 
 async def _test_reasoning(db, parameters: Dict[str, Any]) -> TestResponse:
     """Test reasoning agent (mock test)."""
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     # For now, just test that we can create a reasoning agent
     # In a real test, we'd need a valid model with results
@@ -296,7 +307,7 @@ async def _test_reasoning(db, parameters: Dict[str, Any]) -> TestResponse:
         else:
             details["available_models"] = 0
         
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         
         return TestResponse(
             test_type="reasoning",
@@ -307,7 +318,7 @@ async def _test_reasoning(db, parameters: Dict[str, Any]) -> TestResponse:
         )
         
     except Exception as e:
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         return TestResponse(
             test_type="reasoning",
             success=False,
@@ -318,7 +329,7 @@ async def _test_reasoning(db, parameters: Dict[str, Any]) -> TestResponse:
 
 async def _test_end_to_end(db, parameters: Dict[str, Any]) -> TestResponse:
     """Test complete end-to-end workflow."""
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     details = {}
     
@@ -356,7 +367,7 @@ def simulate(amplitude=1.0, frequency=1.0, phase=0.0):
             
             # 2. Run simulation
             runner = SimulationRunner()
-            result = runner.run(Path(temp_path), {"amplitude": 2.0, "frequency": 0.5})
+            result = await run_blocking(runner.run, Path(temp_path), {"amplitude": 2.0, "frequency": 0.5})
             
             details["simulation_success"] = result.get("_ok", False)
             details["simulation_results"] = {k: v for k, v in result.items() if not k.startswith("_")}
@@ -379,7 +390,7 @@ def simulate(amplitude=1.0, frequency=1.0, phase=0.0):
         finally:
             Path(temp_path).unlink(missing_ok=True)
         
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         
         success = all([
             details.get("model_created"),
@@ -397,7 +408,7 @@ def simulate(amplitude=1.0, frequency=1.0, phase=0.0):
         )
         
     except Exception as e:
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         return TestResponse(
             test_type="end_to_end",
             success=False,
@@ -9,7 +9,7 @@ from fastapi import APIRouter, HTTPException, Depends
 from reasoning import ReasoningAgent
 from db.config.database import DatabaseConfig
 from ..models import ReasoningRequest, ReasoningResponse, StatusResponse
-from ..dependencies import get_database
+from ..dependencies import get_database, run_blocking
 
 
 router = APIRouter()
@@ -30,7 +30,7 @@ async def ask_reasoning_agent(
     Returns the agent's analysis and answer.
     """
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Verify model exists
         from db import get_simulation_path
@@ -47,9 +47,9 @@ async def ask_reasoning_agent(
         )
         
         # Ask question
-        result = agent.ask(request.question)
+        result = await run_blocking(agent.ask, request.question)
         
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         
         return ReasoningResponse(
             answer=result.answer,
@@ -11,7 +11,7 @@ from ..models import (
     SingleSimulationRequest, BatchSimulationRequest, SimulationResult,
     BatchSimulationResponse, StatusResponse, ErrorResponse
 )
-from ..dependencies import get_simulation_service, get_data_service, get_database
+from ..dependencies import get_simulation_service, get_data_service, get_database, run_blocking
 from core.interfaces import SimulationStatus
 
 
@@ -41,7 +41,8 @@ async def import_from_github(
             "imported": "Imported from GitHub"
         }
         
-        model_id = simulation_service.import_model_from_github(
+        model_id = await run_blocking(
+            simulation_service.import_model_from_github,
             github_url=github_url,
             model_name=model_name,
             description=description,
@@ -97,7 +98,8 @@ async def transform_github_script(
             print(f"[TRANSFORM API] Temporary directory created: {temp_dir}")
             # Import and refactor using transform_code
             print(f"[TRANSFORM API] Calling import_and_refactor...")
-            model_id, metadata = importer.import_and_refactor(
+            model_id, metadata = await run_blocking(
+                importer.import_and_refactor,
                 source_url=github_url,
                 model_name=model_name,
                 dest_dir=temp_dir,
@@ -110,7 +112,7 @@ async def transform_github_script(
             try:
                 script_path = get_simulation_path(model_id)
                 print(f"[TRANSFORM API] Script path from database: {script_path}")
-            except:
+            except KeyError:
                 # Fallback to expected path
                 script_path = f"external_models/{model_name}.py"
                 print(f"[TRANSFORM API] Using fallback script path: {script_path}")
@@ -156,7 +158,8 @@ async def run_single_simulation(
     """
     try:
         # Use the service layer
-        result = simulation_service.run_single_simulation(
+        result = await run_blocking(
+            simulation_service.run_single_simulation,
             model_id=request.model_id,
             parameters=request.parameters.model_dump()
         )
@@ -192,13 +195,14 @@ async def run_batch_simulation(
     Returns batch execution results with statistics.
     """
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Convert parameter grid
         param_grid = [params.model_dump() for params in request.parameter_grid]
         
         # Use the service layer
-        results = simulation_service.run_batch_simulations(
+        results = await run_blocking(
+            simulation_service.run_batch_simulations,
             model_id=request.model_id,
             parameter_grid=param_grid
         )
@@ -217,7 +221,7 @@ async def run_batch_simulation(
             )
             api_results.append(api_result)
         
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         successful_runs = sum(1 for r in api_results if r.success)
         failed_runs = len(api_results) - successful_runs
         
@@ -424,7 +428,9 @@ async def get_model_script(model_id: str, simulation_service = Depends(get_simul
         script_path = model_info.get("script_path")
         
         # Try to find the script in common locations if script_path is not available
-        if not script_path:
+        if script_path:
+            possible_paths = [script_path]
+        else:
             # Look for script in external_models directory
             possible_paths = [
                 f"external_models/{model_id}.py",
@@ -432,19 +438,21 @@ async def get_model_script(model_id: str, simulation_service = Depends(get_simul
                 f"systems/models/{model_id}.py",
                 f"systems/models/{model_info.get('name', model_id)}.py"
             ]
-            
-            for path in possible_paths:
-                if Path(path).exists():
-                    script_path = path
-                    break
         
-        if not script_path or not Path(script_path).exists():
+        # Read the first candidate that opens (no separate exists() check per path)
+        script_content = None
+        for path in possible_paths:
+            try:
+                with open(path, 'r') as f:
+                    script_content = f.read()
+            except FileNotFoundError:
+                continue
+            script_path = path
+            break
+        
+        if script_content is None:
             raise HTTPException(status_code=404, detail=f"Script not found for model {model_id}")
         
-        # Read the script file
-        with open(script_path, 'r') as f:
-            script_content = f.read()
-        
         return {
             "status": "success",
             "model_id": model_id,
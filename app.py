@@ -1,5 +1,5 @@
 import json
-import requests
+import httpx
 import pandas as pd
 from typing import Dict, List, Any, Optional
 from pathlib import Path
@@ -7,6 +7,11 @@ import streamlit as st
 from streamlit_chat import message
 import time
 
+try:  # optional: several times faster than stdlib json on large results payloads
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # API Configuration
 API_BASE_URL = "http://127.0.0.1:8001"
 
@@ -14,39 +19,56 @@ API_BASE_URL = "http://127.0.0.1:8001"
 # API Helper Functions
 # ─────────────────────────────────────────────────────────────────────
 
+@st.cache_resource
+def get_client() -> httpx.Client:
+    """Return the shared keep-alive client for the API server.
+
+    Streamlit re-executes the script on every interaction, so the client lives
+    in ``st.cache_resource``; ``httpx.Client`` is thread-safe, so all sessions
+    share one connection pool.
+    """
+    return httpx.Client(
+        timeout=None,  # simulations and reasoning calls can run for minutes
+        follow_redirects=True,
+        headers={"Content-Type": "application/json"},
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30),
+    )
+
 def make_api_request(method: str, endpoint: str, data: Dict = None, params: Dict = None) -> Dict:
     """Make an API request and return the response."""
     url = f"{API_BASE_URL}{endpoint}"
-    headers = {"Content-Type": "application/json"}
+    client = get_client()
     
     try:
         if method.upper() == "GET":
-            response = requests.get(url, headers=headers, params=params)
+            response = client.get(url, params=params)
         elif method.upper() == "POST":
             if params:
                 # Use query parameters for POST requests that expect them
-                response = requests.post(url, headers=headers, params=params)
+                response = client.post(url, params=params)
             else:
                 # Use JSON body for POST requests that expect JSON
-                response = requests.post(url, headers=headers, json=data)
+                response = client.post(url, json=data)
         elif method.upper() == "DELETE":
-            response = requests.delete(url, headers=headers)
+            response = client.delete(url)
         else:
             raise ValueError(f"Unsupported method: {method}")
             
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
         
-    except requests.exceptions.RequestException as e:
+    except (httpx.HTTPError, json.JSONDecodeError) as e:
         st.error(f"API request failed: {e}")
         return {"error": str(e)}
 
 def check_api_health() -> bool:
     """Check if the API server is running."""
     try:
-        result = make_api_request("GET", "/health/status")
-        return "error" not in result
-    except:
+        # HEAD on the liveness probe: this runs on every rerun, so avoid the
+        # full /health/status check (DB query + test simulation)
+        response = get_client().head(f"{API_BASE_URL}/health/live")
+        return response.status_code == 200
+    except httpx.HTTPError:
         return False
 
 def search_models(query: str, limit: int = 10) -> List[Dict]:
@@ -113,15 +135,35 @@ def get_reasoning_history(model_id: str, limit: int = 10) -> List[Dict]:
     result = make_api_request("GET", f"/reasoning/history/{model_id}?limit={limit}")
     return result.get("conversations", []) if "error" not in result else []
 
-def get_model_script(model_id: str) -> str:
-    """Get the refactored script for a model."""
+def get_model_script_entry(model_id: str) -> Dict:
+    """Get the refactored script for a model as {"script", "is_placeholder"}, with caching."""
+    # Check cache first
+    if model_id in st.session_state.cached_model_code:
+        return st.session_state.cached_model_code[model_id]
+    
     result = make_api_request("GET", f"/simulation/models/{model_id}/script")
-    return result.get("script", "") if "error" not in result else ""
+    if "error" in result:
+        return {"script": "", "is_placeholder": False}
+    entry = {
+        "script": result.get("script", ""),
+        "is_placeholder": bool(result.get("is_placeholder", False)),
+    }
+    
+    # Cache real scripts only; placeholders are regenerated until one is saved
+    if entry["script"] and not entry["is_placeholder"]:
+        st.session_state.cached_model_code[model_id] = entry
+    return entry
+
+def get_model_script(model_id: str) -> str:
+    """Get the refactored script for a model with caching."""
+    return get_model_script_entry(model_id)["script"]
 
 def save_model_script(model_id: str, script: str) -> Dict:
     """Save the modified script for a model."""
     data = {"script": script}
     result = make_api_request("POST", f"/simulation/models/{model_id}/script", data)
+    if "error" not in result:
+        st.session_state.cached_model_code[model_id] = {"script": script, "is_placeholder": False}
     return result if "error" not in result else {}
 
 def clear_model_cache(model_id: str = None):
@@ -146,6 +188,11 @@ def clear_model_cache(model_id: str = None):
         st.session_state.cached_model_code.clear()
         st.session_state.cached_search_results.clear()
 
+@st.cache_data(show_spinner=False, max_entries=32)
+def results_to_csv(df: pd.DataFrame) -> str:
+    """Render results as CSV once per distinct table (keyed by content hash)."""
+    return df.to_csv(index=False)
+
 def refresh_model_data(model_id: str):
     """Force refresh of model data by clearing cache and re-fetching."""
     clear_model_cache(model_id)
@@ -522,7 +569,7 @@ elif page == "📊 View Results":
                     st.dataframe(df, use_container_width=True)
                     
                     # Download option
-                    csv = df.to_csv(index=False)
+                    csv = results_to_csv(df)
                     st.download_button(
                         label="📥 Download Results as CSV",
                         data=csv,
@@ -887,12 +934,12 @@ elif page == "📝 Parameter Annotations":
                     # Script Management
                     st.header("3. Script Management")
                     
-                    # Get current script
-                    script_result = make_api_request("GET", f"/simulation/models/{model_id}/script")
+                    # Get current script (cached, so widget reruns skip the API call)
+                    script_entry = get_model_script_entry(model_id)
+                    current_script = script_entry["script"]
                     
-                    if "error" not in script_result:
-                        current_script = script_result.get("script", "")
-                        is_placeholder = script_result.get("is_placeholder", False)
+                    if current_script:
+                        is_placeholder = script_entry["is_placeholder"]
                         
                         if is_placeholder:
                             st.subheader("📝 Script Editor (Placeholder)")
@@ -1007,7 +1054,7 @@ elif page == "🔍 Model Search":
                                 metadata = json.loads(model['metadata']) if isinstance(model['metadata'], str) else model['metadata']
                                 st.write("**Metadata:**")
                                 st.json(metadata)
-                            except:
+                            except (TypeError, ValueError):
                                 st.write(f"**Metadata:** {model['metadata']}")
                     
                     with col2:
@@ -4,7 +4,6 @@ from core.parser import tidy_json
 
 from pathlib import Path
 import json, re
-import openai
 import os
 
 def extract_script_settings(
@@ -16,6 +15,8 @@ def extract_script_settings(
     Return a flat settings dict: name -> default (float for numerics/fractions; else original).
     Uses gpt-5-mini by default. Robust to malformed LLM output.
     """
+    import openai  # local import: only needed when a script is actually imported
+
     # Set OpenAI API key from config
     try:
         from utils.config import settings
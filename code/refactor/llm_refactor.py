@@ -3,7 +3,6 @@ import os
 from pathlib import Path
 from typing import Any, Tuple
 
-import openai
 from code.extract.llm_extract import extract_script_settings  # assumes this is defined elsewhere
 
 
@@ -18,6 +17,8 @@ def refactor_to_single_entry(
     which overrides all internally defined parameters and returns a dict.
     Uses an agentic retry loop to recover from malformed generations.
     """
+    import openai  # local import: only needed when a script is actually imported
+
     print(f"[LLM_REFACTOR] Starting refactor_to_single_entry for {script_path}")
     original_source = script_path.read_text().strip()
     print(f"[LLM_REFACTOR] Original source length: {len(original_source)}")
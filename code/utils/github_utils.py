@@ -1,6 +1,28 @@
+import os
+import tempfile
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 
+CHUNK_SIZE = 1 << 16
+
+# Shared keep-alive session for GitHub downloads: repeated imports reuse the
+# TCP/TLS connection, and transient 5xx/connection errors on GETs are retried.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        # Hand the final 5xx response back so raise_for_status() reports it
+        raise_on_status=False,
+    ),
+))
+
 def fetch_notebook_from_github(github_url: str, dest_dir: str = "external_models") -> str:
     """
     Downloads a file from a GitHub URL and saves it locally.
@@ -15,12 +37,21 @@ def fetch_notebook_from_github(github_url: str, dest_dir: str = "external_models
     
     print(f"[GITHUB_UTILS] Converting {github_url} to {raw_url}")
     
-    resp = requests.get(raw_url)
-    resp.raise_for_status()
-
     Path(dest_dir).mkdir(exist_ok=True, parents=True)
     filename = Path(raw_url).name
     local_path = Path(dest_dir) / filename
-    local_path.write_bytes(resp.content)
+
+    # Stream to a temp file next to the target so large notebooks are never held
+    # in memory in full, then swap it in; a failed download leaves no partial file.
+    tmp = tempfile.NamedTemporaryFile(dir=dest_dir, prefix=f".{filename}.", suffix=".part", delete=False)
+    try:
+        with tmp, SESSION.get(raw_url, stream=True) as resp:
+            resp.raise_for_status()
+            for chunk in resp.iter_content(chunk_size=CHUNK_SIZE):
+                tmp.write(chunk)
+        os.replace(tmp.name, local_path)
+    except BaseException:
+        Path(tmp.name).unlink(missing_ok=True)
+        raise
     print(f"[GITHUB_UTILS] Downloaded file to {local_path}")
     return str(local_path)
@@ -5,6 +5,8 @@ This module provides concrete implementations of various design patterns
 to improve code organization and maintainability.
 """
 
+import functools
+import re
 import threading
 import weakref
 import logging
@@ -83,7 +85,7 @@ class LocalExecutionStrategy:
         self.logger.info(f"[LOCAL_EXECUTION] Parameters: {request.parameters}")
         self.logger.info(f"[LOCAL_EXECUTION] Timeout: {self.timeout}s")
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Import here to avoid circular dependencies
@@ -100,7 +102,7 @@ class LocalExecutionStrategy:
             self.logger.info(f"[LOCAL_EXECUTION] Running simulation with runner")
             result = runner.run(script_path, request.parameters)
             
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             self.logger.info(f"[LOCAL_EXECUTION] Simulation completed in {execution_time:.3f}s")
             
             success = result.get("_ok", False)
@@ -124,7 +126,7 @@ class LocalExecutionStrategy:
             )
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             self.logger.error(f"[LOCAL_EXECUTION] Execution failed after {execution_time:.3f}s: {str(e)}")
             self.logger.error(f"[LOCAL_EXECUTION] Error type: {type(e).__name__}")
             
@@ -520,6 +522,37 @@ class ResourceManager(metaclass=SingletonMeta):
 
 # ===== ADAPTER PATTERN =====
 
+# raw.githubusercontent.com URLs whose ref is a full commit SHA are immutable
+_SHA_PINNED_RAW_URL = re.compile(
+    r"^https://raw\.githubusercontent\.com/[^/]+/[^/]+/[0-9a-f]{40}/"
+)
+
+
+def _download_script_text(raw_url: str) -> str:
+    """Download a raw script over the shared GitHub session."""
+    from code.utils.github_utils import SESSION
+    response = SESSION.get(raw_url)
+    response.raise_for_status()
+    return response.text
+
+
+@functools.lru_cache(maxsize=128)
+def _fetch_pinned_script_text(raw_url: str) -> str:
+    """Download a commit-pinned raw script, once per URL for the lifetime of the process."""
+    return _download_script_text(raw_url)
+
+
+def _fetch_script_text(raw_url: str) -> str:
+    """Download a raw script, memoizing only URLs pinned to a commit SHA.
+
+    Branch and tag URLs (e.g. ``/main/``) are mutable, so they are always
+    fetched fresh to pick up upstream edits.
+    """
+    if _SHA_PINNED_RAW_URL.match(raw_url):
+        return _fetch_pinned_script_text(raw_url)
+    return _download_script_text(raw_url)
+
+
 class GitHubScriptAdapter:
     """Adapter for importing scripts from GitHub."""
     
@@ -542,12 +575,8 @@ class GitHubScriptAdapter:
         else:
             raw_url = source
         
-        # Download the script content
-        import requests
-        response = requests.get(raw_url)
-        response.raise_for_status()
-        
-        script_content = response.text
+        # Download the script content (commit-pinned URLs are memoized)
+        script_content = _fetch_script_text(raw_url)
         
         # Adapt to SimExR format (ensure it has a simulate function)
         if "def simulate(" not in script_content:
@@ -31,6 +31,7 @@ class ServiceConfiguration:
     results_directory: str = "results_media"
     default_timeout: float = 30.0
     max_batch_size: int = 1000
+    batch_flush_size: int = 100
     enable_logging: bool = True
     log_file: Optional[str] = None
 
@@ -72,9 +73,10 @@ class SimulationService:
         self, 
         model_id: str, 
         parameters: Dict[str, Any],
-        timeout: Optional[float] = None
+        timeout: Optional[float] = None,
+        store_results: bool = True
     ) -> SimulationResult:
-        """Run a single simulation."""
+        """Run a single simulation; `store_results=False` skips the DB write (batch stores once)."""
         self.logger.info(f"Running simulation for model {model_id}")
         
         try:
@@ -87,7 +89,7 @@ class SimulationService:
             self.logger.info(f"Simulation completed with status: {result.status.value}")
             
             # Save results to database if successful
-            if result.status == SimulationStatus.COMPLETED:
+            if store_results and result.status == SimulationStatus.COMPLETED:
                 try:
                     from db import store_simulation_results
                     
@@ -136,7 +138,13 @@ class SimulationService:
             use_tqdm = False
             self.logger.warning("tqdm not available, running without progress bar")
         
+        total = len(parameter_grid)
         results = []
+        # Successful rows waiting to be written, grouped by their own parameter keys
+        # (grids may mix key sets, and {} for all-defaults runs). A group is flushed
+        # as soon as it reaches batch_flush_size, so a crash loses at most one chunk.
+        pending_rows: Dict[tuple, List[Dict[str, Any]]] = {}
+        saved = 0
         iterator = tqdm(parameter_grid, desc=f"Running {model_id} simulations") if use_tqdm else enumerate(parameter_grid)
         
         for i, parameters in (enumerate(iterator) if use_tqdm else iterator):
@@ -147,12 +155,23 @@ class SimulationService:
                 # Manual enumeration
                 i = i
             
-            self.logger.info(f"Running simulation {i+1}/{len(parameter_grid)}")
+            self.logger.info(f"Running simulation {i+1}/{total}")
             self.logger.debug(f"Parameters: {parameters}")
             
             try:
-                result = self.run_single_simulation(model_id, parameters)
+                result = self.run_single_simulation(model_id, parameters, store_results=False)
                 results.append(result)
+                if result.status == SimulationStatus.COMPLETED:
+                    keys = tuple(result.parameters)
+                    rows = pending_rows.setdefault(keys, [])
+                    rows.append({
+                        **result.parameters,  # Include all parameters
+                        **result.outputs,     # Include all outputs
+                        '_ok': True,          # Mark as successful
+                        '_execution_time': result.execution_time
+                    })
+                    if len(rows) >= self.config.batch_flush_size:
+                        saved += self._store_batch_rows(model_id, keys, pending_rows.pop(keys))
                 if use_tqdm:
                     iterator.set_postfix({"status": "success"})
             except Exception as e:
@@ -172,38 +191,24 @@ class SimulationService:
         successful = sum(1 for r in results if r.status == SimulationStatus.COMPLETED)
         self.logger.info(f"Batch completed: {successful}/{len(results)} successful")
         
-        # Save successful results to database
+        # Save the remaining partial chunks
+        for keys, rows in pending_rows.items():
+            saved += self._store_batch_rows(model_id, keys, rows)
         if successful > 0:
-            try:
-                from db import store_simulation_results
-                
-                # Convert successful SimulationResults to the format expected by store_simulation_results
-                successful_rows = []
-                param_keys = None
-                
-                for result in results:
-                    if result.status == SimulationStatus.COMPLETED:
-                        result_row = {
-                            **result.parameters,  # Include all parameters
-                            **result.outputs,     # Include all outputs
-                            '_ok': True,          # Mark as successful
-                            '_execution_time': result.execution_time
-                        }
-                        successful_rows.append(result_row)
-                        
-                        # Use parameter keys from the first successful result
-                        if param_keys is None:
-                            param_keys = list(result.parameters.keys())
-                
-                if successful_rows and param_keys:
-                    store_simulation_results(model_id, successful_rows, param_keys)
-                    self.logger.info(f"Saved {len(successful_rows)} results to database for model {model_id}")
-                
-            except Exception as save_error:
-                self.logger.warning(f"Failed to save batch results to database: {save_error}")
+            self.logger.info(f"Saved {saved}/{successful} results to database for model {model_id}")
         
         return results
     
+    def _store_batch_rows(self, model_id: str, keys: tuple, rows: List[Dict[str, Any]]) -> int:
+        """Write one chunk of batch rows sharing `keys`; returns the number of rows written."""
+        try:
+            from db import store_simulation_results
+            store_simulation_results(model_id, rows, list(keys))
+            return len(rows)
+        except Exception as save_error:
+            self.logger.warning(f"Failed to save {len(rows)} batch results to database: {save_error}")
+            return 0
+    
     def import_model_from_github(
         self,
         github_url: str,
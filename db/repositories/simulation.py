@@ -45,20 +45,20 @@ class SimulationRepository(AbstractBaseRepository):
             rows: List of result dictionaries from simulation runs
             param_keys: List of parameter names used in the simulation
         """
+        # Split each row into params and outputs up front, then insert in one call
+        records = [
+            (
+                model_id,
+                self._extract_parameters(row, param_keys),
+                self._extract_results(row, param_keys),
+            )
+            for row in rows
+        ]
         with self.db_config.get_sqlite_connection() as conn:
-            for row in rows:
-                # Split data into params and outputs
-                params = self._extract_parameters(row, param_keys)
-                outputs = self._extract_results(row, param_keys)
-
-                conn.execute("""
+            conn.executemany("""
                              INSERT INTO results (model_id, params, outputs, ts)
                              VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-                             """, (
-                                 model_id,
-                                 params,
-                                 outputs
-                             ))
+                             """, records)
 
     @staticmethod
     def _extract_parameters(row: dict, param_keys: List[str]) -> str:
@@ -7,7 +7,7 @@ import pandas as pd
 
 from ..repositories.simulation import SimulationRepository
 from ..utils.json_utils import _safe_parse
-from ..utils.transform_utils import _explode_row
+from ..utils.transform_utils import _explode_rows
 from ..base import BaseResultsService
 
 # Import sanitize_metadata with fallback
@@ -39,15 +39,19 @@ class ResultsService(BaseResultsService):
             and shorter arrays are padded with None to match the longest length.
           - If a run has no arrays at all, it's kept as a single row with step=0.
         """
+        # Filter in SQL so rows for other models are never fetched or JSON-decoded.
+        query = "SELECT model_id, params, outputs, ts FROM results"
+        query_params: tuple = ()
+        if model_id is not None:
+            query += " WHERE model_id = ?"
+            query_params = (model_id,)
+
         con = sqlite3.connect(str(db_path))
         try:
-            raw_df = pd.read_sql("SELECT model_id, params, outputs, ts FROM results", con)
+            raw_df = pd.read_sql(query, con, params=query_params)
         finally:
             con.close()
 
-        if model_id is not None:
-            raw_df = raw_df[raw_df["model_id"] == model_id].reset_index(drop=True)
-
         # Parse JSON
         raw_df["params"] = raw_df["params"].apply(_safe_parse)
         raw_df["outputs"] = raw_df["outputs"].apply(_safe_parse)
@@ -55,21 +59,11 @@ class ResultsService(BaseResultsService):
         # Drop unparseable rows
         raw_df = raw_df[raw_df["params"].apply(bool) & raw_df["outputs"].apply(bool)].reset_index(drop=True)
 
-        # Explode each row based on list-like fields
-        exploded_frames: list[pd.DataFrame] = []
-        for _, r in raw_df.iterrows():
-            exploded = _explode_row(
-                model_id=r["model_id"],
-                ts=r["ts"],
-                params=r["params"],
-                outputs=r["outputs"],
-            )
-            exploded_frames.append(exploded)
-
-        if not exploded_frames:
+        if raw_df.empty:
             return pd.DataFrame(columns=["model_id", "ts", "step"])
 
-        final = pd.concat(exploded_frames, ignore_index=True)
+        # Explode each row based on list-like fields, accumulating columns for one frame
+        final = _explode_rows(zip(raw_df["model_id"], raw_df["ts"], raw_df["params"], raw_df["outputs"]))
 
         # Optional: stable column ordering → id/timestamps first, then others (params before outputs if you want)
         # Already merged; if you need specific ordering, you can sort keys or provide a custom order here.
@@ -2,6 +2,6 @@
 
 from .hash_utils import generate_model_id
 from .json_utils import _safe_parse
-from .transform_utils import _explode_row, _is_listy, _to_list
+from .transform_utils import _explode_row, _explode_rows, _is_listy, _to_list
 
-__all__ = ["generate_model_id", "_safe_parse", "_explode_row", "_is_listy", "_to_list"]
+__all__ = ["generate_model_id", "_safe_parse", "_explode_row", "_explode_rows", "_is_listy", "_to_list"]
@@ -5,12 +5,22 @@ from typing import List, Dict, Any
 import pandas as pd
 import numpy as np
 
+try:  # optional: faster decoding of stored params/outputs
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def _safe_parse(x: Any) -> dict:
     if isinstance(x, dict):
         return x
     if x is None or (isinstance(x, float) and pd.isna(x)):
         return {}
+    if orjson is not None:
+        try:
+            return orjson.loads(x)
+        except Exception:
+            pass  # e.g. NaN/Infinity tokens written by json.dumps; retry with stdlib
     try:
         return json.loads(x)
     except Exception:
@@ -1,17 +1,19 @@
-from typing import Any
+from typing import Any, Dict, Iterable, Tuple
 
+import numpy as np
 import pandas as pd
 
+# Resolved once at import; _is_listy runs for every key of every stored row
+_LISTY_TYPES = (list, tuple, np.ndarray, pd.Series)
+
 
 def _is_listy(v: Any) -> bool:
     """Check if value is list-like (list, tuple, numpy array, pandas Series)."""
-    import numpy as np
-    return isinstance(v, (list, tuple, np.ndarray, pd.Series))
+    return isinstance(v, _LISTY_TYPES)
 
 
 def _to_list(v: Any) -> list:
     """Convert value to list format."""
-    import numpy as np
     if isinstance(v, np.ndarray):
         return v.tolist()
     if isinstance(v, pd.Series):
@@ -22,18 +24,18 @@ def _to_list(v: Any) -> list:
     return [v]
 
 
-def _explode_row(model_id: str, ts: Any, params: dict, outputs: dict) -> pd.DataFrame:
+def _explode_columns(model_id: str, ts: Any, params: dict, outputs: dict) -> Tuple[int, Dict[str, list]]:
     """
     Explode a single row where some fields in params/outputs may be arrays.
     Strategy:
       - Collect all keys from params + outputs
       - Determine the per-key sequence lengths (only for list-like values)
-      - If no list-like values exist → return a single-row dataframe
+      - If no list-like values exist → return a single row
       - Otherwise, define max_len = max(list lengths)
       - For each key:
           * if list-like: pad/truncate to max_len (pads with None)
           * if scalar: repeat the scalar max_len times
-      - Return a dataframe with max_len rows, adding a 'step' index (0..max_len-1)
+      - Return (n_rows, columns) with a 'step' index (0..max_len-1)
     """
     # Flatten key space
     all_keys = list(dict.fromkeys([*params.keys(), *outputs.keys()]))
@@ -41,9 +43,9 @@ def _explode_row(model_id: str, ts: Any, params: dict, outputs: dict) -> pd.Data
     # Compute lengths for list-like values
     lengths = []
     for k in all_keys:
-        v = params.get(k, outputs.get(k, None))  # prefer params; either is fine for length check
+        v = params[k] if k in params else outputs.get(k)  # prefer params; either is fine for length check
         if _is_listy(v):
-            lengths.append(len(_to_list(v)))
+            lengths.append(len(v))
 
     if not lengths:
         # No arrays: single-row record
@@ -51,7 +53,7 @@ def _explode_row(model_id: str, ts: Any, params: dict, outputs: dict) -> pd.Data
         # Merge params & outputs; params take precedence on key collisions
         merged = {**outputs, **params}
         row.update(merged)
-        return pd.DataFrame([row])
+        return 1, {k: [v] for k, v in row.items()}
 
     max_len = max(lengths)
 
@@ -82,6 +84,33 @@ def _explode_row(model_id: str, ts: Any, params: dict, outputs: dict) -> pd.Data
     for k in all_keys:
         data[k] = _series_for(k)
 
+    return max_len, data
+
+
+def _explode_row(model_id: str, ts: Any, params: dict, outputs: dict) -> pd.DataFrame:
+    """Explode a single row into a DataFrame (see `_explode_columns`)."""
+    _, data = _explode_columns(model_id, ts, params, outputs)
     return pd.DataFrame(data)
 
 
+def _explode_rows(rows: Iterable[Tuple[str, Any, dict, dict]]) -> pd.DataFrame:
+    """
+    Explode many (model_id, ts, params, outputs) rows into one DataFrame.
+
+    Columns are accumulated as plain lists and the frame is built once, instead of
+    one DataFrame per row plus pd.concat. Keys missing from a row are None.
+    """
+    columns: Dict[str, list] = {}
+    total = 0
+    for model_id, ts, params, outputs in rows:
+        n, data = _explode_columns(model_id, ts, params, outputs)
+        for k in data:
+            if k not in columns:
+                columns[k] = [None] * total
+        for k, col in columns.items():
+            if k in data:
+                col.extend(data[k])
+            else:
+                col.extend([None] * n)
+        total += n
+    return pd.DataFrame(columns)
@@ -1,15 +1,32 @@
 import uuid
+import hashlib
 import importlib.util
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Callable, Any
+from types import CodeType
+from typing import Callable, Any, Tuple
+
+# Compiled script code keyed by (resolved path, content digest), shared by all
+# loaders so repeated runs of an unchanged script skip reading and compiling it.
+# Only the code object is cached: the module body still executes on every load,
+# so import-time state (np.random.seed(...), prints) is reset per run.
+_CACHE_SIZE = 128
+_CODE_CACHE: "OrderedDict[Tuple[str, bytes], CodeType]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
 
 
 class SimulateLoader:
-    """Dynamically import simulate() from a file path under a random module name."""
+    """
+    Dynamically import simulate() from a file path under a random module name.
+    Compiled code is cached by file contents (the module body still runs on every
+    import); pass cache=False to always read and compile from disk.
+    """
     
-    def __init__(self):
+    def __init__(self, cache: bool = True):
         self._importlib_util = importlib.util
+        self.cache = cache
         self.logger = logging.getLogger("SimulateLoader")
         self.logger.setLevel(logging.INFO)
     
@@ -30,6 +47,25 @@ class SimulateLoader:
         """
         self.logger.info(f"[SIMULATE_LOADER] Starting import of simulate function from {script_path}")
         
+        use_cache = self.cache and iu is None
+        code = None
+        if use_cache:
+            resolved = Path(script_path).resolve()
+            source = resolved.read_bytes()
+            key = (str(resolved), hashlib.blake2b(source, digest_size=16).digest())
+            with _CACHE_LOCK:
+                code = _CODE_CACHE.get(key)
+                if code is not None:
+                    _CODE_CACHE.move_to_end(key)
+            if code is None:
+                code = compile(source, str(resolved), "exec")
+                with _CACHE_LOCK:
+                    _CODE_CACHE[key] = code
+                    if len(_CODE_CACHE) > _CACHE_SIZE:
+                        _CODE_CACHE.popitem(last=False)
+            else:
+                self.logger.info("[SIMULATE_LOADER] Using cached compiled code")
+
         import_util = iu if iu is not None else self._importlib_util
         name = f"simulate_{uuid.uuid4().hex}"
         self.logger.info(f"[SIMULATE_LOADER] Generated module name: {name}")
@@ -44,7 +80,10 @@ class SimulateLoader:
         mod = import_util.module_from_spec(spec)
         
         self.logger.info(f"[SIMULATE_LOADER] Executing module")
-        spec.loader.exec_module(mod)  # type: ignore[attr-defined]
+        if code is not None:
+            exec(code, mod.__dict__)
+        else:
+            spec.loader.exec_module(mod)  # type: ignore[attr-defined]
         
         self.logger.info(f"[SIMULATE_LOADER] Checking for simulate function")
         if not hasattr(mod, "simulate"):
@@ -4,6 +4,15 @@ import logging.handlers
 import sys
 from pathlib import Path
 
+try:  # optional: several times faster than stdlib json for large result rows
+    import orjson
+except ImportError:
+    orjson = None
+
+# Log directories already created in this process; every run logs to the same
+# one, so the mkdir is only needed on first use.
+_READY_LOG_DIRS: set = set()
+
 
 class RunLogger:
     """
@@ -13,7 +22,9 @@ class RunLogger:
     @staticmethod
     def _ensure_log_dir(script_path: Path) -> Path:
         log_dir = script_path.parent / "logs"
-        log_dir.mkdir(parents=True, exist_ok=True)
+        if log_dir not in _READY_LOG_DIRS:
+            log_dir.mkdir(parents=True, exist_ok=True)
+            _READY_LOG_DIRS.add(log_dir)
         return log_dir
 
     @staticmethod
@@ -46,6 +57,20 @@ class RunLogger:
     @staticmethod
     def append_jsonl(script_path: Path, record: dict, filename: str = "runs.jsonl") -> None:
         p = RunLogger._ensure_log_dir(script_path) / filename
-        p.parent.mkdir(parents=True, exist_ok=True)
-        with p.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        line = None
+        if orjson is not None:
+            try:
+                line = orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY)
+            except TypeError:
+                line = None  # non-str keys or unsupported types: fall back to stdlib
+        if line is None:
+            line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        try:
+            with p.open("ab") as f:
+                f.write(line)
+        except FileNotFoundError:
+            # logs dir removed after it was memoized (tmp cleaner, manual cleanup): recreate it
+            _READY_LOG_DIRS.discard(p.parent)
+            RunLogger._ensure_log_dir(script_path)
+            with p.open("ab") as f:
+                f.write(line)
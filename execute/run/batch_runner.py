@@ -54,10 +54,13 @@ class BatchRunner(BaseRunner):
         if str(model_dir) not in sys.path:
             sys.path.insert(0, str(model_dir))
 
+        # Loop invariants bound once rather than re-resolved for every run
+        total = len(param_grid)
+        run_one = self.single_runner.run
         rows: List[Dict[str, Any]] = []
         for i, p in enumerate(tqdm(param_grid, desc=f"Running {model_id}"), start=1):
-            logger.info(f"[BATCH] run {i}/{len(param_grid)}")
-            row = self.single_runner.run(script_path, p)
+            logger.info(f"[BATCH] run {i}/{total}")
+            row = run_one(script_path, p)
             rows.append(row)
             if not row.get("_ok", False):
                 logger.warning(f"[BATCH] run {i} failed: {row.get('_error_type')} | {row.get('_error_msg')}")
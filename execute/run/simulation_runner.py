@@ -1,5 +1,6 @@
 import datetime
 import io
+import time
 import traceback
 import logging
 from contextlib import redirect_stdout, redirect_stderr
@@ -39,13 +40,13 @@ class SimulationRunner(BaseRunner):
         logger.info(f"[RUN] start simulate | script={script_path.name} | run_id={run_id}")
         logger.debug(f"[RUN] params={params}")
 
-        start_ts = datetime.datetime.utcnow()
+        start = time.perf_counter()
         cap_out, cap_err = io.StringIO(), io.StringIO()
 
         try:
             self.logger.info(f"[SIMULATION_RUNNER] Executing simulation...")
             result = self._execute_simulation(script_path, params, cap_out, cap_err)
-            duration = (datetime.datetime.utcnow() - start_ts).total_seconds()
+            duration = time.perf_counter() - start
             
             self.logger.info(f"[SIMULATION_RUNNER] Simulation completed successfully in {duration:.3f}s")
             self.logger.info(f"[SIMULATION_RUNNER] Result keys: {list(result.keys())}")
@@ -57,7 +58,7 @@ class SimulationRunner(BaseRunner):
             self._log_success(logger, duration, result, row)
             
         except Exception as e:
-            duration = (datetime.datetime.utcnow() - start_ts).total_seconds()
+            duration = time.perf_counter() - start
             self.logger.error(f"[SIMULATION_RUNNER] Simulation failed after {duration:.3f}s: {str(e)}")
             self.logger.error(f"[SIMULATION_RUNNER] Error type: {type(e).__name__}")
             
@@ -21,8 +21,9 @@ class ErrorContext:
         )
 
     def runtime(self, trace: str, limit: int = 25) -> str:
-        tb_tail = "\n".join(trace.splitlines()[-limit:]) or "<no traceback captured>"
-        last = trace.strip().splitlines()[-1] if trace else "<no output>"
+        lines = trace.splitlines()
+        tb_tail = "\n".join(lines[-limit:]) or "<no traceback captured>"
+        last = next((l.rstrip() for l in reversed(lines) if l.strip()), "<no output>")
         return (
             f"RuntimeError `{last}`\n"
             f"Traceback (last {limit} lines):\n{tb_tail}\n\n"
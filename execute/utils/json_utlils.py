@@ -1,30 +1,86 @@
+import datetime as dt
 import json
-from typing import Any
+from typing import Any, Callable, Dict
 
 import numpy as np
 
 
+def _identity(val: Any) -> Any:
+    return val
+
+
+def _convert_dict(val: dict) -> dict:
+    return {k: json_convert(v) for k, v in val.items()}
+
+
+def _convert_seq(val: Any) -> list:
+    return [json_convert(v) for v in val]
+
+
+def _convert_ndarray(val: np.ndarray) -> list:
+    # bool/int/float arrays already tolist() to plain JSON-safe Python values
+    if val.dtype.kind in "biuf":
+        return val.tolist()
+    return [json_convert(v) for v in val.tolist()]
+
+
+def _convert_bytes(val: Any) -> str:
+    return val.decode("utf-8", errors="replace")
+
+
+def _convert_complex(val: complex) -> dict:
+    return {"real": float(val.real), "imag": float(val.imag)}
+
+
+def _convert_isoformat(val: Any) -> str:
+    return val.isoformat()
+
+
+# Exact-type dispatch, built once. Subclasses and numpy scalars fall through
+# to the isinstance chain in json_convert.
+_HANDLERS: Dict[type, Callable[[Any], Any]] = {
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    type(None): _identity,
+    dict: _convert_dict,
+    list: _convert_seq,
+    tuple: _convert_seq,
+    set: _convert_seq,
+    np.ndarray: _convert_ndarray,
+    bytes: _convert_bytes,
+    bytearray: _convert_bytes,
+    complex: _convert_complex,
+    dt.datetime: _convert_isoformat,
+    dt.date: _convert_isoformat,
+    dt.time: _convert_isoformat,
+}
+
+
 def json_convert(val: Any) -> Any:
-    import datetime as dt
+    handler = _HANDLERS.get(type(val))
+    if handler is not None:
+        return handler(val)
 
     if isinstance(val, (np.generic,)):
         return val.item()
     if isinstance(val, np.ndarray):
-        return [json_convert(v) for v in val.tolist()]
+        return _convert_ndarray(val)
     if isinstance(val, set):
-        return [json_convert(v) for v in val]
+        return _convert_seq(val)
     if isinstance(val, (dt.datetime, dt.date, dt.time)):
         return val.isoformat()
     if isinstance(val, (bytes, bytearray)):
-        return val.decode("utf-8", errors="replace")
+        return _convert_bytes(val)
     if isinstance(val, complex):
-        return {"real": float(val.real), "imag": float(val.imag)}
+        return _convert_complex(val)
     if isinstance(val, dict):
-        return {k: json_convert(v) for k, v in val.items()}
+        return _convert_dict(val)
     if isinstance(val, (list, tuple)):
-        return [json_convert(v) for v in val]
+        return _convert_seq(val)
     try:
         json.dumps(val)
         return val
     except Exception:
-        return str(val)
\ No newline at end of file
+        return str(val)
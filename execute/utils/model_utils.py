@@ -24,7 +24,7 @@ def make_variant_name(model_id: str, new_script: str, hash_len: int = 12) -> tup
       variant_path     = Path(get_simulation_path(prefix)).with_name(variant_name)
     """
     # Strip any '::suffix' if present
-    base = model_id.split("::", 1)[0]
+    base = model_id.partition("::")[0]
 
     # Extract prefix by removing a trailing _<hexhash> (6..64 hex chars) if present
     m = re.match(r"^(?P<prefix>.+?)_(?P<hash>[0-9a-fA-F]{6,64})$", base)
@@ -1,4 +1,3 @@
-import re
 import textwrap
 
 
@@ -11,9 +10,14 @@ class CodeUtils:
         Given an LLM response that may contain explanation + fenced code,
         extract just the Python code (same logic you had, packaged).
         """
-        m = re.search(r"```(?:python)?\s*([\s\S]+?)```", response, re.IGNORECASE)
-        if m:
-            return m.group(1).strip()
+        start = response.find("```")
+        if start != -1:
+            end = response.find("```", start + 4)
+            if end != -1:
+                code = response[start + 3:end]
+                if code[:6].lower() == "python":
+                    code = code[6:]
+                return code.strip()
 
         idx = response.find("def simulate")
         if idx != -1:
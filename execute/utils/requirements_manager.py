@@ -7,6 +7,10 @@ from typing import List, Iterable
 
 from execute.base import BaseManager
 
+_REQUIREMENTS_RE = re.compile(r"REQUIREMENTS\s*=\s*\[(.*?)\]", re.S)
+_QUOTED_RE = re.compile(r"[\"']([^\"']+)[\"']")
+_IMPORT_RE = re.compile(r"(?:import|from)\s+([\w_]+)")
+
 
 @dataclass
 class RequirementManager(BaseManager):
@@ -22,17 +26,16 @@ class RequirementManager(BaseManager):
         """
         pkgs: List[str] = []
 
-        m = re.search(r"REQUIREMENTS\s*=\s*\[(.*?)\]", script, re.S)
+        m = _REQUIREMENTS_RE.search(script)
         if m:
-            pkgs.extend(re.findall(r"[\"']([^\"']+)[\"']", m.group(1)))
+            pkgs.extend(_QUOTED_RE.findall(m.group(1)))
 
         for line in script.splitlines():
             line = line.strip()
             if not line or line.startswith("#"):
                 continue
-            m1 = re.match(r"import\s+([\w_]+)", line)
-            m2 = re.match(r"from\s+([\w_]+)", line)
-            name = m1.group(1) if m1 else (m2.group(1) if m2 else None)
+            m = _IMPORT_RE.match(line)
+            name = m.group(1) if m else None
             if name and name not in self._IGNORE:
                 pkgs.append(name)
 
@@ -3,36 +3,56 @@
 
 import streamlit as st
 import json
-import requests
+import httpx
 import pandas as pd
 from typing import Dict, List, Any
 import time
 
+try:  # optional: several times faster than stdlib json on large results payloads
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # API Configuration
 API_BASE_URL = "http://127.0.0.1:8001"
 
+@st.cache_resource
+def get_client() -> httpx.Client:
+    """Return the shared keep-alive client for the API server.
+
+    Streamlit re-executes the script on every interaction, so the client lives
+    in ``st.cache_resource``; ``httpx.Client`` is thread-safe, so all sessions
+    share one connection pool.
+    """
+    return httpx.Client(
+        timeout=None,  # simulations and reasoning calls can run for minutes
+        follow_redirects=True,
+        headers={"Content-Type": "application/json"},
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30),
+    )
+
 def make_api_request(method: str, endpoint: str, data: Dict = None, params: Dict = None) -> Dict:
     """Make an API request and return the response."""
     url = f"{API_BASE_URL}{endpoint}"
-    headers = {"Content-Type": "application/json"}
+    client = get_client()
     
     try:
         if method.upper() == "GET":
-            response = requests.get(url, headers=headers, params=params)
+            response = client.get(url, params=params)
         elif method.upper() == "POST":
             if params:
-                response = requests.post(url, headers=headers, params=params)
+                response = client.post(url, params=params)
             else:
-                response = requests.post(url, headers=headers, json=data)
+                response = client.post(url, json=data)
         elif method.upper() == "DELETE":
-            response = requests.delete(url, headers=headers)
+            response = client.delete(url)
         else:
             raise ValueError(f"Unsupported method: {method}")
             
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
         
-    except requests.exceptions.RequestException as e:
+    except (httpx.HTTPError, json.JSONDecodeError) as e:
         st.error(f"API request failed: {e}")
         return {"error": str(e)}
 
@@ -68,17 +88,38 @@ def get_model_info(model_id: str) -> Dict:
     
     return model_info
 
-def get_model_script(model_id: str) -> str:
-    """Get the refactored script for a model."""
+def get_model_script_entry(model_id: str) -> Dict:
+    """Get the refactored script for a model as {"script", "is_placeholder"}, with caching."""
+    # Check cache first
+    if model_id in st.session_state.cached_model_code:
+        return st.session_state.cached_model_code[model_id]
+    
     result = make_api_request("GET", f"/simulation/models/{model_id}/script")
-    return result.get("script", "") if "error" not in result else ""
+    if "error" in result:
+        return {"script": "", "is_placeholder": False}
+    entry = {
+        "script": result.get("script", ""),
+        "is_placeholder": bool(result.get("is_placeholder", False)),
+    }
+    
+    # Cache real scripts only; placeholders are regenerated until one is saved
+    if entry["script"] and not entry["is_placeholder"]:
+        st.session_state.cached_model_code[model_id] = entry
+    return entry
+
+def get_model_script(model_id: str) -> str:
+    """Get the refactored script for a model with caching."""
+    return get_model_script_entry(model_id)["script"]
 
 def save_model_script(model_id: str, script: str) -> Dict:
     """Save the modified script for a model."""
     data = {"script": script}
     result = make_api_request("POST", f"/simulation/models/{model_id}/script", data)
+    if "error" not in result:
+        st.session_state.cached_model_code[model_id] = {"script": script, "is_placeholder": False}
     return result
 
+@st.cache_data(show_spinner=False, max_entries=64)
 def extract_parameters_from_script(script_content: str) -> Dict:
     """Extract parameters from script content using simple AST analysis."""
     import ast
@@ -236,10 +277,7 @@ if search_query:
                 extracted_params = model_info.get('parameters', {})
                 
                 # Get script content for parameter extraction
-                script_result = make_api_request("GET", f"/simulation/models/{model_id}/script")
-                script_content = ""
-                if "error" not in script_result:
-                    script_content = script_result.get("script", "")
+                script_content = get_model_script(model_id)
                 
                 # Extract parameters from script if not available in model info
                 if not extracted_params and script_content:
@@ -79,10 +79,12 @@ class ReasoningAgent(BaseAgent):
     
     def _build_tools(self, df: Any) -> None:
         """Build tools bound to this session."""
+        # Both simulation tool names are served by one SimulateTools instance
+        sim_tools = SimulateTools(db_config=self.db_config, default_model_id=self.model_id)
         self._tools = {
             "python_exec": PythonExecTool(df=df),
-            "run_simulation_for_model": SimulateTools(db_config=self.db_config, default_model_id=self.model_id),
-            "run_batch_for_model": SimulateTools(db_config=self.db_config, default_model_id=self.model_id),
+            "run_simulation_for_model": sim_tools,
+            "run_batch_for_model": sim_tools,
             "final_answer": FinalAnswerTool(),
         }
     
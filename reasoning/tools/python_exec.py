@@ -38,6 +38,13 @@ from pydantic import BaseModel, Field, PrivateAttr
 
 ExecMode = Literal["analysis", "simulate"]
 
+
+def _png_files(path: str = ".") -> set:
+    """Names of PNG files directly under `path`, from a single scandir pass."""
+    with os.scandir(path) as it:
+        return {e.name for e in it if e.name.lower().endswith(".png") and e.is_file()}
+
+
 class PythonExecArgs(BaseModel):
     code: Optional[str] = Field(default=None, description="Python source to execute.")
     mode: ExecMode = Field(default="analysis", description="'analysis' or 'simulate'")
@@ -83,7 +90,7 @@ class PythonExecTool(BaseTool):
 
     # -------- analysis mode (unchanged behavior) --------
     def run_python(self, code: str, df: Optional[pd.DataFrame]) -> Dict[str, Any]:
-        before = {f for f in os.listdir() if f.lower().endswith(".png")}
+        before = _png_files()
         images: List[str] = []
         old_show = _capture_show(images)
 
@@ -102,7 +109,7 @@ class PythonExecTool(BaseTool):
         finally:
             plt.show = old_show
 
-        after = {f for f in os.listdir() if f.lower().endswith(".png")}
+        after = _png_files()
         new_images = sorted(after - before)
         # also include images saved via our plt.show hook
         for p in images:
@@ -17,16 +17,18 @@ def load_results(
     Returns a DataFrame with columns:
       model_id, ts, <all params fields>, <all output fields>
     """
-    # 1) fetch raw rows
+    # 1) fetch raw rows, 2) optionally filtered to only the given model_id
+    #    (done in SQL so other models' rows are never fetched or parsed)
+    query = "SELECT model_id, params, outputs, ts FROM results"
+    query_params: tuple = ()
+    if model_id is not None:
+        query += " WHERE model_id = ?"
+        query_params = (model_id,)
+    print("===========",model_id,"==========")
     con = sqlite3.connect(str(db_path))
-    raw_df = pd.read_sql("SELECT model_id, params, outputs, ts FROM results", con)
+    raw_df = pd.read_sql(query, con, params=query_params)
     con.close()
 
-    # print(raw_df.head())
-    # 2) optionally filter to only the given model_id
-    print("===========",model_id,"==========")
-    if model_id is not None:
-        raw_df = raw_df[raw_df["model_id"] == model_id]
     # print(raw_df.head())
     # 3) parse the JSON columns safely
     raw_df["params"] = raw_df["params"].apply(_safe_parse)
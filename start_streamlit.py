@@ -15,9 +15,9 @@ from pathlib import Path
 def check_api_server():
     """Check if the API server is running."""
     try:
-        response = requests.get("http://127.0.0.1:8001/health/status", timeout=5)
+        response = requests.head("http://127.0.0.1:8001/health/live", timeout=5)
         return response.status_code == 200
-    except:
+    except requests.RequestException:
         return False
 
 def main():